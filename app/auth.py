@@ -6,11 +6,12 @@ import secrets
 import random
 from typing import Optional
 from datetime import datetime, timedelta, timezone
+from app.config import settings
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
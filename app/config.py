@@ -1,7 +1,7 @@
 """
 Application configuration using environment variables
 """
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, model_validator
 from pydantic_settings import BaseSettings
 from typing import List, Optional
 
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     DATABASE_POOL_MIN_SIZE: int = 2
     DATABASE_POOL_MAX_SIZE: int = 10
     DATABASE_COMMAND_TIMEOUT: int = 60
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
     
     # CORS Configuration
     # Require explicit frontend origins in env (no baked-in default)
@@ -38,6 +39,9 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     
+    # Password hashing (bcrypt work factor; below 10 only when ENVIRONMENT=test)
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31, description="bcrypt work factor for new password hashes")
+    
     # Email Configuration
     EMAIL_ENABLED: bool = True
     EMAIL_FROM_ADDRESS: str = Field("noreply@vayada.com", description="Email address to send from")
@@ -81,6 +85,13 @@ class Settings(BaseSettings):
         case_sensitive=True
     )
     
+    @model_validator(mode="after")
+    def check_bcrypt_rounds(self) -> "Settings":
+        """Only the test suite may lower the bcrypt work factor below 10"""
+        if self.BCRYPT_ROUNDS < 10 and self.ENVIRONMENT != "test":
+            raise ValueError("BCRYPT_ROUNDS below 10 is only allowed when ENVIRONMENT=test")
+        return self
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins from comma-separated string"""
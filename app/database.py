@@ -2,7 +2,8 @@
 Database connection and utilities
 """
 import asyncpg
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from app.config import settings
 
 
@@ -19,7 +20,8 @@ class Database:
                 settings.DATABASE_URL,
                 min_size=settings.DATABASE_POOL_MIN_SIZE,
                 max_size=settings.DATABASE_POOL_MAX_SIZE,
-                command_timeout=settings.DATABASE_COMMAND_TIMEOUT
+                command_timeout=settings.DATABASE_COMMAND_TIMEOUT,
+                statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE
             )
         return cls._pool
     
@@ -30,33 +32,37 @@ class Database:
             await cls._pool.close()
             cls._pool = None
     
+    @classmethod
+    @asynccontextmanager
+    async def acquire(cls) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection from the pool"""
+        pool = await cls.get_pool()
+        async with pool.acquire() as connection:
+            yield connection
+    
     @classmethod
     async def execute(cls, query: str, *args):
         """Execute a query"""
         pool = await cls.get_pool()
-        async with pool.acquire() as connection:
-            return await connection.execute(query, *args)
+        return await pool.execute(query, *args)
     
     @classmethod
     async def fetch(cls, query: str, *args):
         """Fetch multiple rows"""
         pool = await cls.get_pool()
-        async with pool.acquire() as connection:
-            return await connection.fetch(query, *args)
+        return await pool.fetch(query, *args)
     
     @classmethod
     async def fetchrow(cls, query: str, *args):
         """Fetch a single row"""
         pool = await cls.get_pool()
-        async with pool.acquire() as connection:
-            return await connection.fetchrow(query, *args)
+        return await pool.fetchrow(query, *args)
     
     @classmethod
     async def fetchval(cls, query: str, *args):
         """Fetch a single value"""
         pool = await cls.get_pool()
-        async with pool.acquire() as connection:
-            return await connection.fetchval(query, *args)
+        return await pool.fetchval(query, *args)
 
 
 async def check_database_connection() -> dict:
@@ -8,10 +8,10 @@ from decimal import Decimal
 from pydantic import ValidationError
 import logging
 import json
-import bcrypt
 
 from app.database import Database
 from app.dependencies import get_current_user_id
+from app.auth import hash_password
 from app.routers.collaborations import get_collaboration_deliverables
 from app.s3_service import delete_all_objects_in_prefix, delete_file_from_s3, extract_key_from_url
 
@@ -460,10 +460,7 @@ async def create_user(
             )
         
         # Hash password
-        password_hash = bcrypt.hashpw(
-            request.password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        password_hash = hash_password(request.password)
         
         # Insert user into database
         user = await Database.fetchrow(
@@ -558,8 +555,7 @@ async def create_user(
             
             # Create listings if provided
             if profile_data.listings:
-                pool = await Database.get_pool()
-                async with pool.acquire() as conn:
+                async with Database.acquire() as conn:
                     async with conn.transaction():
                         for listing_request in profile_data.listings:
                             # Create listing
@@ -702,8 +698,7 @@ async def update_creator_profile(
         creator_id = creator['id']
         
         # Start transaction - update user name, creator profile, and platforms
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Update user name if provided
                 if request.name is not None:
@@ -1239,8 +1234,7 @@ async def create_hotel_listing(
         hotel_profile_id = hotel_profile['id']
         
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Create listing
                 listing = await conn.fetchrow(
@@ -1497,8 +1491,7 @@ async def update_hotel_listing(
         current_listing = listing_data["listing"]
         
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Build dynamic UPDATE query for listing
                 update_fields = []
@@ -1723,8 +1716,7 @@ async def delete_hotel_listing(
                             # Don't count thumbnail failures as critical
         
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Delete collaboration offerings (cascade should handle this, but being explicit)
                 await conn.execute(
@@ -174,10 +174,7 @@ async def register(request: RegisterRequest):
             )
 
         # Hash password
-        password_hash = bcrypt.hashpw(
-            request.password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        password_hash = hash_password(request.password)
 
         # Use provided name or default to email prefix
         user_name = request.name
@@ -175,8 +175,7 @@ async def create_collaboration(
         
         
         # Create collaboration
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 collaboration = await conn.fetchrow(
                     """
@@ -345,8 +344,7 @@ async def respond_to_collaboration_request(
         
         query = f"UPDATE collaborations SET {', '.join(updates)} WHERE id = ${len(params)} RETURNING *"
         
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 await conn.execute(query, *params)
                 
@@ -568,8 +566,7 @@ async def update_collaboration_terms(
         update_query = f"UPDATE collaborations SET {', '.join(updates)} WHERE id = $1"
         update_params.insert(0, collaboration_id)
         
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 await conn.execute(update_query, *update_params)
                 
@@ -704,8 +701,7 @@ async def approve_collaboration_terms(
             new_status = 'accepted'
         
         query = f"UPDATE collaborations SET {', '.join(updates)} WHERE id = $1"
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 await conn.execute(query, collaboration_id)
                 await create_system_message(collaboration_id, f"✅ {sender_name} approved the terms.", conn=conn)
@@ -808,8 +804,7 @@ async def cancel_collaboration(
             "updated_at = NOW()"
         ]
         
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 await conn.execute(f"UPDATE collaborations SET {', '.join(updates)} WHERE id = $1", collaboration_id)
                 
@@ -44,9 +44,22 @@ async def get_creator_profile_status(user_id: str = Depends(get_current_user_id_
     - completion_steps: Human-readable steps to complete the profile
     """
     try:
-        # Verify user is a creator
+        # Load user, creator profile and platform validity in one round trip.
+        # A platform is valid if it has a handle and followers > 0
         user = await Database.fetchrow(
-            "SELECT id, type, name FROM users WHERE id = $1",
+            """
+            SELECT u.id, u.type, u.name,
+                   c.id AS creator_id, c.location, c.short_description,
+                   EXISTS (
+                       SELECT 1 FROM creator_platforms cp
+                       WHERE cp.creator_id = c.id
+                         AND cp.handle ~ '\\S'
+                         AND cp.followers > 0
+                   ) AS has_valid_platform
+            FROM users u
+            LEFT JOIN creators c ON c.user_id = u.id
+            WHERE u.id = $1
+            """,
             user_id
         )
         
@@ -62,32 +75,12 @@ async def get_creator_profile_status(user_id: str = Depends(get_current_user_id_
                 detail="This endpoint is only available for creators"
             )
         
-        # Get creator profile
-        creator = await Database.fetchrow(
-            """
-            SELECT id, location, short_description, portfolio_link, phone
-            FROM creators
-            WHERE user_id = $1
-            """,
-            user_id
-        )
-        
-        if not creator:
+        if user['creator_id'] is None:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Creator profile not found"
             )
         
-        # Check for platforms
-        platforms = await Database.fetch(
-            """
-            SELECT id, name, handle, followers, engagement_rate
-            FROM creator_platforms
-            WHERE creator_id = $1
-            """,
-            creator['id']
-        )
-        
         # Determine missing fields
         missing_fields = []
         completion_steps = []
@@ -98,23 +91,16 @@ async def get_creator_profile_status(user_id: str = Depends(get_current_user_id_
             completion_steps.append("Add your name")
         
         # Check location
-        if not creator['location'] or not creator['location'].strip():
+        if not user['location'] or not user['location'].strip():
             missing_fields.append("location")
             completion_steps.append("Set your location")
         
         # Check short_description
-        if not creator['short_description'] or not creator['short_description'].strip():
+        if not user['short_description'] or not user['short_description'].strip():
             missing_fields.append("short_description")
             completion_steps.append("Add a short description about yourself")
         
-        # Check for platforms
-        # A platform is valid if it has a handle and followers > 0
-        valid_platforms = [
-            p for p in platforms
-            if p['handle'] and p['handle'].strip() and p['followers'] and p['followers'] > 0
-        ]
-        
-        missing_platforms = len(valid_platforms) == 0
+        missing_platforms = not user['has_valid_platform']
         
         if missing_platforms:
             completion_steps.append("Add at least one social media platform")
@@ -323,8 +309,7 @@ async def update_creator_profile(
         old_profile_picture = creator.get('profile_picture')
         
         # Start transaction - update user name, creator profile, and platforms
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Update user name if provided
                 if request.name is not None:
@@ -746,8 +746,7 @@ async def create_hotel_listing(
         hotel_profile_id = await get_current_hotel_profile_id(user_id)
         
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Create listing
                 listing = await conn.fetchrow(
@@ -970,8 +969,7 @@ async def update_hotel_listing(
         old_images = current_listing.get('images') or []
 
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Build dynamic UPDATE query for listing
                 update_fields = []
@@ -1147,8 +1145,7 @@ async def delete_hotel_listing(
             )
         
         # Use transaction to ensure atomicity
-        pool = await Database.get_pool()
-        async with pool.acquire() as conn:
+        async with Database.acquire() as conn:
             async with conn.transaction():
                 # Delete collaboration offerings (cascade should handle this, but being explicit)
                 await conn.execute(
@@ -5,11 +5,14 @@ import pytest
 from httpx import AsyncClient
 
 from app.database import Database
+from app.jwt_utils import create_access_token
 from tests.conftest import (
     get_auth_headers,
+    create_test_user,
     create_test_creator,
     create_test_hotel,
     create_test_admin,
+    create_test_users_bulk,
     create_test_listing,
     create_test_platform,
     create_test_collaboration,
@@ -26,7 +29,7 @@ class TestGetUsers:
         """Test getting users list."""
         response = await client.get(
             "/admin/users",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -40,12 +43,11 @@ class TestGetUsers:
     ):
         """Test pagination of users list."""
         # Create multiple users
-        for i in range(5):
-            await create_test_creator()
+        await create_test_users_bulk(5)
 
         response = await client.get(
             "/admin/users?page=1&page_size=3",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -59,7 +61,7 @@ class TestGetUsers:
         """Test filtering users by type."""
         response = await client.get(
             "/admin/users?type=creator",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -76,7 +78,7 @@ class TestGetUsers:
 
         response = await client.get(
             "/admin/users?status=verified",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -92,7 +94,7 @@ class TestGetUsers:
 
         response = await client.get(
             "/admin/users?search=Unique Name",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -105,7 +107,7 @@ class TestGetUsers:
         """Test that non-admin cannot access users list."""
         response = await client.get(
             "/admin/users",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -130,7 +132,7 @@ class TestGetUserDetails:
 
         response = await client.get(
             f"/admin/users/{user_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -148,7 +150,7 @@ class TestGetUserDetails:
 
         response = await client.get(
             f"/admin/users/{user_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -164,7 +166,7 @@ class TestGetUserDetails:
         """Test getting non-existent user."""
         response = await client.get(
             "/admin/users/00000000-0000-0000-0000-000000000000",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -193,7 +195,7 @@ class TestCreateUser:
                     "shortDescription": "Professional content creator"
                 }
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -243,7 +245,7 @@ class TestCreateUser:
                     ]
                 }
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -262,7 +264,7 @@ class TestCreateUser:
                 "name": "Duplicate User",
                 "type": "creator"
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -293,7 +295,7 @@ class TestCreateUser:
                     ]
                 }
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -311,7 +313,7 @@ class TestUpdateUser:
         response = await client.put(
             f"/admin/users/{user_id}",
             json={"status": "verified"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -328,7 +330,7 @@ class TestUpdateUser:
         response = await client.put(
             f"/admin/users/{user_id}",
             json={"email": new_email},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -342,7 +344,7 @@ class TestUpdateUser:
         response = await client.put(
             "/admin/users/00000000-0000-0000-0000-000000000000",
             json={"name": "Test"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -356,7 +358,7 @@ class TestUpdateUser:
         response = await client.put(
             f"/admin/users/{admin_id}",
             json={"status": "suspended"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -374,7 +376,7 @@ class TestDeleteUser:
 
         response = await client.delete(
             f"/admin/users/{user_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -398,7 +400,7 @@ class TestDeleteUser:
 
         response = await client.delete(
             f"/admin/users/{user_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -416,7 +418,7 @@ class TestDeleteUser:
         """Test deleting non-existent user."""
         response = await client.delete(
             "/admin/users/00000000-0000-0000-0000-000000000000",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -429,7 +431,7 @@ class TestDeleteUser:
 
         response = await client.delete(
             f"/admin/users/{admin_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -451,7 +453,7 @@ class TestUpdateCreatorProfile:
                 "location": "San Francisco, USA",
                 "shortDescription": "Updated description"
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -477,7 +479,7 @@ class TestUpdateCreatorProfile:
                     }
                 ]
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -494,7 +496,7 @@ class TestUpdateCreatorProfile:
         response = await client.put(
             f"/admin/users/{user_id}/profile/creator",
             json={"name": "Test"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -516,7 +518,7 @@ class TestUpdateHotelProfile:
                 "location": "Barcelona, Spain",
                 "about": "Updated description"
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -533,7 +535,7 @@ class TestUpdateHotelProfile:
         response = await client.put(
             f"/admin/users/{user_id}/profile/hotel",
             json={"name": "Test"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -569,7 +571,7 @@ class TestAdminCreateListing:
                     "minFollowers": 50000
                 }
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -600,7 +602,7 @@ class TestAdminCreateListing:
                 ],
                 "creatorRequirements": {"platforms": ["Instagram"], "minFollowers": 1000}
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -622,7 +624,7 @@ class TestAdminUpdateListing:
                 "name": "Admin Updated Listing",
                 "description": "Updated by admin"
             },
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -638,7 +640,7 @@ class TestAdminUpdateListing:
         response = await client.put(
             f"/admin/users/{user_id}/listings/00000000-0000-0000-0000-000000000000",
             json={"name": "Test"},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -656,7 +658,7 @@ class TestAdminDeleteListing:
 
         response = await client.delete(
             f"/admin/users/{user_id}/listings/{listing_id}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -671,7 +673,7 @@ class TestAdminDeleteListing:
 
         response = await client.delete(
             f"/admin/users/{user_id}/listings/00000000-0000-0000-0000-000000000000",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -686,7 +688,7 @@ class TestAdminGetCollaborations:
         """Test getting all collaborations."""
         response = await client.get(
             "/admin/collaborations",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -700,7 +702,7 @@ class TestAdminGetCollaborations:
         """Test collaborations pagination."""
         response = await client.get(
             "/admin/collaborations?page=1&page_size=10",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -713,7 +715,7 @@ class TestAdminGetCollaborations:
         """Test filtering collaborations by status."""
         response = await client.get(
             "/admin/collaborations?status=pending",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -729,7 +731,7 @@ class TestAdminGetCollaborations:
 
         response = await client.get(
             f"/admin/collaborations?search={creator_name}",
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -746,7 +748,7 @@ class TestAdminAuthorization:
         """Test that creator cannot access admin endpoints."""
         response = await client.get(
             "/admin/users",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -757,7 +759,7 @@ class TestAdminAuthorization:
         """Test that hotel cannot access admin endpoints."""
         response = await client.get(
             "/admin/users",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -766,9 +768,6 @@ class TestAdminAuthorization:
         self, client: AsyncClient, cleanup_database, init_database
     ):
         """Test that suspended admin cannot access endpoints."""
-        from tests.conftest import create_test_user
-        from app.jwt_utils import create_access_token
-
         admin_user = await create_test_user(
             user_type="admin",
             status="suspended"
@@ -2,16 +2,19 @@
 Tests for authentication endpoints.
 """
 import pytest
+from datetime import timedelta
 from httpx import AsyncClient
 from unittest.mock import patch, AsyncMock
 
+from app.auth import create_email_verification_token
 from app.database import Database
+from app.jwt_utils import create_access_token
 from tests.conftest import (
     get_auth_headers,
     create_test_user,
     create_test_creator,
     generate_test_email,
-    hash_password
+    TEST_PASSWORD,
 )
 
 
@@ -51,7 +54,7 @@ class TestSendVerificationCode:
         assert "message" in data
 
     async def test_send_verification_code_invalid_email(
-        self, client: AsyncClient, cleanup_database
+        self, client: AsyncClient
     ):
         """Test sending verification code with invalid email format."""
         response = await client.post(
@@ -240,7 +243,7 @@ class TestRegister:
         assert "already registered" in response.json()["detail"].lower()
 
     async def test_register_weak_password(
-        self, client: AsyncClient, cleanup_database
+        self, client: AsyncClient
     ):
         """Test registration with weak password."""
         email = generate_test_email()
@@ -260,7 +263,7 @@ class TestRegister:
         assert response.status_code == 422  # Validation error
 
     async def test_register_missing_fields(
-        self, client: AsyncClient, cleanup_database
+        self, client: AsyncClient
     ):
         """Test registration with missing required fields."""
         response = await client.post(
@@ -271,7 +274,7 @@ class TestRegister:
         assert response.status_code == 422
 
     async def test_register_invalid_type(
-        self, client: AsyncClient, cleanup_database
+        self, client: AsyncClient
     ):
         """Test registration with invalid user type."""
         response = await client.post(
@@ -296,12 +299,11 @@ class TestLogin:
         self, client: AsyncClient, cleanup_database
     ):
         """Test successful login."""
-        password = "TestPassword123!"
-        user = await create_test_user(password=password)
+        user = await create_test_user()
 
         response = await client.post(
             "/auth/login",
-            json={"email": user["email"], "password": password}
+            json={"email": user["email"], "password": TEST_PASSWORD}
         )
 
         assert response.status_code == 200
@@ -326,7 +328,7 @@ class TestLogin:
         self, client: AsyncClient, cleanup_database
     ):
         """Test login with wrong password."""
-        user = await create_test_user(password="CorrectPassword123!")
+        user = await create_test_user()
 
         response = await client.post(
             "/auth/login",
@@ -340,12 +342,11 @@ class TestLogin:
         self, client: AsyncClient, cleanup_database
     ):
         """Test login with suspended account."""
-        password = "TestPassword123!"
-        user = await create_test_user(password=password, status="suspended")
+        user = await create_test_user(status="suspended")
 
         response = await client.post(
             "/auth/login",
-            json={"email": user["email"], "password": password}
+            json={"email": user["email"], "password": TEST_PASSWORD}
         )
 
         assert response.status_code == 403
@@ -361,7 +362,7 @@ class TestValidateToken:
         """Test validation of valid token."""
         response = await client.post(
             "/auth/validate-token",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -375,9 +376,6 @@ class TestValidateToken:
         self, client: AsyncClient, cleanup_database
     ):
         """Test validation of expired token."""
-        from datetime import timedelta
-        from app.jwt_utils import create_access_token
-
         user = await create_test_user()
         # Create token that expired 1 hour ago
         expired_token = create_access_token(
@@ -570,8 +568,6 @@ class TestVerifyEmail:
         self, client: AsyncClient, cleanup_database
     ):
         """Test successful email verification via token."""
-        from app.auth import create_email_verification_token
-
         user = await create_test_user()
         token = await create_email_verification_token(str(user["id"]), expires_in_hours=48)
 
@@ -6,7 +6,6 @@ from httpx import AsyncClient
 
 from app.database import Database
 from tests.conftest import (
-    get_auth_headers,
     create_test_creator,
     create_test_hotel,
     create_test_listing,
@@ -26,12 +25,12 @@ class TestGetConversations:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -47,12 +46,12 @@ class TestGetConversations:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -71,20 +70,20 @@ class TestGetConversations:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Send a message from hotel
         await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Hello!", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Get conversations as creator
         response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -100,7 +99,7 @@ class TestGetConversations:
         # Don't accept the collaboration - leave it pending
         response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -131,12 +130,12 @@ class TestGetChatMessages:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.get(
             f"/collaborations/{collab_id}/messages",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -155,12 +154,12 @@ class TestGetChatMessages:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.get(
             f"/collaborations/{collab_id}/messages",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -178,19 +177,19 @@ class TestGetChatMessages:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         for i in range(5):
             await client.post(
                 f"/collaborations/{collab_id}/messages",
                 json={"content": f"Message {i}", "message_type": "text"},
-                headers=get_auth_headers(test_collaboration["creator"]["token"])
+                headers=test_collaboration["creator"]["auth_headers"]
             )
 
         response = await client.get(
             f"/collaborations/{collab_id}/messages?limit=3",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -208,13 +207,13 @@ class TestGetChatMessages:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Get all messages first
         all_response = await client.get(
             f"/collaborations/{collab_id}/messages",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
         all_data = all_response.json()
 
@@ -223,7 +222,7 @@ class TestGetChatMessages:
 
             response = await client.get(
                 f"/collaborations/{collab_id}/messages?before={before_time}",
-                headers=get_auth_headers(test_collaboration["creator"]["token"])
+                headers=test_collaboration["creator"]["auth_headers"]
             )
 
             assert response.status_code == 200
@@ -242,13 +241,13 @@ class TestSendChatMessage:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Hello, looking forward to our collaboration!", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -266,13 +265,13 @@ class TestSendChatMessage:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Welcome! We're excited to host you.", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -301,13 +300,13 @@ class TestSendChatMessage:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         # Depending on validation, this could be 200 (empty message allowed) or 422
@@ -327,19 +326,19 @@ class TestMarkMessagesAsRead:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Unread message", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Creator marks as read
         response = await client.post(
             f"/collaborations/{collab_id}/read",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -356,19 +355,19 @@ class TestMarkMessagesAsRead:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Message 1", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Check unread count before
         conv_response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
         conv_data = conv_response.json()
         collab_conv = [c for c in conv_data if c["collaboration_id"] == collab_id]
@@ -378,13 +377,13 @@ class TestMarkMessagesAsRead:
             # Mark as read
             await client.post(
                 f"/collaborations/{collab_id}/read",
-                headers=get_auth_headers(test_collaboration["creator"]["token"])
+                headers=test_collaboration["creator"]["auth_headers"]
             )
 
             # Check unread count after
             conv_response_after = await client.get(
                 "/collaborations/conversations",
-                headers=get_auth_headers(test_collaboration["creator"]["token"])
+                headers=test_collaboration["creator"]["auth_headers"]
             )
             conv_data_after = conv_response_after.json()
             collab_conv_after = [c for c in conv_data_after if c["collaboration_id"] == collab_id]
@@ -414,13 +413,13 @@ class TestChatMessageTypes:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.post(
             f"/collaborations/{collab_id}/messages",
             json={"content": "Text message", "message_type": "text"},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -434,8 +433,6 @@ class TestChatConversationOrdering:
         self, client: AsyncClient, cleanup_database, init_database
     ):
         """Test that conversations are ordered by last message time."""
-        from tests.conftest import create_test_creator, create_test_hotel, create_test_listing, create_test_collaboration
-
         # Create two collaborations
         creator = await create_test_creator()
 
@@ -459,32 +456,32 @@ class TestChatConversationOrdering:
         await client.post(
             f"/collaborations/{collab1['id']}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(hotel1["token"])
+            headers=hotel1["auth_headers"]
         )
         await client.post(
             f"/collaborations/{collab2['id']}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(hotel2["token"])
+            headers=hotel2["auth_headers"]
         )
 
         # Send message in collab1 first
         await client.post(
             f"/collaborations/{collab1['id']}/messages",
             json={"content": "First", "message_type": "text"},
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         # Then send in collab2
         await client.post(
             f"/collaborations/{collab2['id']}/messages",
             json={"content": "Second", "message_type": "text"},
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         # Get conversations
         response = await client.get(
             "/collaborations/conversations",
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -7,15 +7,66 @@ from datetime import date, timedelta
 
 from app.database import Database
 from tests.conftest import (
-    get_auth_headers,
-    create_test_creator,
     create_test_hotel,
     create_test_listing,
     create_test_collaboration,
     create_test_platform,
+    get_first_deliverable_id,
 )
 
 
+# Date strings N days from today, computed once for the whole module
+_TODAY = date.today()
+FUTURE_DATES = {days: str(_TODAY + timedelta(days=days)) for days in (30, 35, 45, 50, 60, 67)}
+
+# Shared platform_deliverables payloads; tests only read these, never mutate them
+INSTAGRAM_REELS_AND_STORIES = [
+    {
+        "platform": "Instagram",
+        "deliverables": [
+            {"type": "Reel", "quantity": 2, "status": "pending"},
+            {"type": "Story", "quantity": 5, "status": "pending"}
+        ]
+    }
+]
+INSTAGRAM_POSTS = [
+    {
+        "platform": "Instagram",
+        "deliverables": [{"type": "Post", "quantity": 5, "status": "pending"}]
+    }
+]
+INSTAGRAM_SINGLE_POST = [
+    {
+        "platform": "Instagram",
+        "deliverables": [{"type": "Post", "quantity": 1, "status": "pending"}]
+    }
+]
+INSTAGRAM_STORIES = [
+    {
+        "platform": "Instagram",
+        "deliverables": [{"type": "Story", "quantity": 10, "status": "pending"}]
+    }
+]
+TIKTOK_VIDEOS = [
+    {
+        "platform": "TikTok",
+        "deliverables": [{"type": "Video", "quantity": 3, "status": "pending"}]
+    }
+]
+
+
+def creator_collaboration_body(listing_id: str, **fields) -> dict:
+    """Build a creator-initiated collaboration request with default travel dates and consent."""
+    return {
+        "initiator_type": "creator",
+        "listing_id": listing_id,
+        "travel_date_from": FUTURE_DATES[30],
+        "travel_date_to": FUTURE_DATES[35],
+        "consent": True,
+        **fields
+    }
+
+
 class TestCreateCollaboration:
     """Tests for POST /collaborations"""
 
@@ -27,27 +78,15 @@ class TestCreateCollaboration:
 
         response = await client.post(
             "/collaborations",
-            json={
-                "initiator_type": "creator",
-                "listing_id": listing_id,
-                "collaboration_type": "Free Stay",
-                "why_great_fit": "I love this hotel and would create amazing content!",
-                "free_stay_min_nights": 3,
-                "free_stay_max_nights": 5,
-                "travel_date_from": str(date.today() + timedelta(days=30)),
-                "travel_date_to": str(date.today() + timedelta(days=35)),
-                "platform_deliverables": [
-                    {
-                        "platform": "Instagram",
-                        "deliverables": [
-                            {"type": "Reel", "quantity": 2, "status": "pending"},
-                            {"type": "Story", "quantity": 5, "status": "pending"}
-                        ]
-                    }
-                ],
-                "consent": True
-            },
-            headers=get_auth_headers(test_creator_verified["token"])
+            json=creator_collaboration_body(
+                listing_id,
+                collaboration_type="Free Stay",
+                why_great_fit="I love this hotel and would create amazing content!",
+                free_stay_min_nights=3,
+                free_stay_max_nights=5,
+                platform_deliverables=INSTAGRAM_REELS_AND_STORIES
+            ),
+            headers=test_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -73,18 +112,11 @@ class TestCreateCollaboration:
                 "why_great_fit": "We think you'd be perfect for our brand!",
                 "free_stay_min_nights": 4,
                 "free_stay_max_nights": 7,
-                "preferred_date_from": str(date.today() + timedelta(days=60)),
-                "preferred_date_to": str(date.today() + timedelta(days=67)),
-                "platform_deliverables": [
-                    {
-                        "platform": "TikTok",
-                        "deliverables": [
-                            {"type": "Video", "quantity": 3, "status": "pending"}
-                        ]
-                    }
-                ]
+                "preferred_date_from": FUTURE_DATES[60],
+                "preferred_date_to": FUTURE_DATES[67],
+                "platform_deliverables": TIKTOK_VIDEOS
             },
-            headers=get_auth_headers(test_hotel_verified["token"])
+            headers=test_hotel_verified["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -100,25 +132,14 @@ class TestCreateCollaboration:
 
         response = await client.post(
             "/collaborations",
-            json={
-                "initiator_type": "creator",
-                "listing_id": listing_id,
-                "collaboration_type": "Paid",
-                "why_great_fit": "Professional content creator",
-                "paid_amount": 5000,
-                "travel_date_from": str(date.today() + timedelta(days=30)),
-                "travel_date_to": str(date.today() + timedelta(days=35)),
-                "platform_deliverables": [
-                    {
-                        "platform": "Instagram",
-                        "deliverables": [
-                            {"type": "Post", "quantity": 5, "status": "pending"}
-                        ]
-                    }
-                ],
-                "consent": True
-            },
-            headers=get_auth_headers(test_creator_verified["token"])
+            json=creator_collaboration_body(
+                listing_id,
+                collaboration_type="Paid",
+                why_great_fit="Professional content creator",
+                paid_amount=5000,
+                platform_deliverables=INSTAGRAM_POSTS
+            ),
+            headers=test_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -135,25 +156,14 @@ class TestCreateCollaboration:
 
         response = await client.post(
             "/collaborations",
-            json={
-                "initiator_type": "creator",
-                "listing_id": listing_id,
-                "collaboration_type": "Discount",
-                "why_great_fit": "Would love a discount stay",
-                "discount_percentage": 50,
-                "travel_date_from": str(date.today() + timedelta(days=30)),
-                "travel_date_to": str(date.today() + timedelta(days=35)),
-                "platform_deliverables": [
-                    {
-                        "platform": "Instagram",
-                        "deliverables": [
-                            {"type": "Story", "quantity": 10, "status": "pending"}
-                        ]
-                    }
-                ],
-                "consent": True
-            },
-            headers=get_auth_headers(test_creator_verified["token"])
+            json=creator_collaboration_body(
+                listing_id,
+                collaboration_type="Discount",
+                why_great_fit="Would love a discount stay",
+                discount_percentage=50,
+                platform_deliverables=INSTAGRAM_STORIES
+            ),
+            headers=test_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -175,18 +185,13 @@ class TestCreateCollaboration:
                 "creator_id": str(test_creator_verified["creator"]["id"]),
                 "collaboration_type": "Free Stay",
                 "why_great_fit": "Test",
-                "platform_deliverables": [
-                    {
-                        "platform": "Instagram",
-                        "deliverables": [{"type": "Post", "quantity": 1, "status": "pending"}]
-                    }
-                ]
+                "platform_deliverables": INSTAGRAM_SINGLE_POST
             },
-            headers=get_auth_headers(test_creator_verified["token"])
+            headers=test_creator_verified["auth_headers"]
         )
 
         # API may return 403 (forbidden), 400 (bad request), or 422 (validation error) for this scenario
-        assert response.status_code in [400, 403, 422]
+        assert response.status_code in (400, 403, 422)
 
 
 class TestRespondToCollaboration:
@@ -202,7 +207,7 @@ class TestRespondToCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted", "response_message": "We'd love to work with you!"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -218,7 +223,7 @@ class TestRespondToCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "declined", "response_message": "Not a good fit right now"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -235,14 +240,14 @@ class TestRespondToCollaboration:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Try to respond again
         response = await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "declined"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -256,7 +261,7 @@ class TestRespondToCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -275,7 +280,7 @@ class TestUpdateCollaborationTerms:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.put(
@@ -284,7 +289,7 @@ class TestUpdateCollaborationTerms:
                 "collaboration_type": "Paid",
                 "paid_amount": 3000
             },
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -303,7 +308,7 @@ class TestUpdateCollaborationTerms:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.put(
@@ -311,7 +316,7 @@ class TestUpdateCollaborationTerms:
             json={
                 "stay_nights": 5
             },
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -329,11 +334,11 @@ class TestUpdateCollaborationTerms:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
-        new_from = str(date.today() + timedelta(days=45))
-        new_to = str(date.today() + timedelta(days=50))
+        new_from = FUTURE_DATES[45]
+        new_to = FUTURE_DATES[50]
 
         response = await client.put(
             f"/collaborations/{collab_id}/terms",
@@ -341,7 +346,7 @@ class TestUpdateCollaborationTerms:
                 "travel_date_from": new_from,
                 "travel_date_to": new_to
             },
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -358,14 +363,14 @@ class TestUpdateCollaborationTerms:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Hotel updates terms
         response = await client.put(
             f"/collaborations/{collab_id}/terms",
             json={"stay_nights": 7},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -384,7 +389,7 @@ class TestUpdateCollaborationTerms:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         response = await client.put(
@@ -399,7 +404,7 @@ class TestUpdateCollaborationTerms:
                     }
                 ]
             },
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -421,13 +426,13 @@ class TestApproveCollaboration:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Creator approves
         response = await client.post(
             f"/collaborations/{collab_id}/approve",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -446,13 +451,13 @@ class TestApproveCollaboration:
         await client.post(
             f"/collaborations/{collab_id}/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         # Creator approves
         await client.post(
             f"/collaborations/{collab_id}/approve",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         # Verify collaboration is accepted
@@ -463,15 +468,14 @@ class TestApproveCollaboration:
         assert collab["status"] == "accepted"
 
     async def test_non_participant_cannot_approve(
-        self, client: AsyncClient, test_collaboration, cleanup_database, init_database
+        self, client: AsyncClient, test_collaboration, shared_creator
     ):
         """Test that non-participant cannot approve."""
-        other_creator = await create_test_creator()
         collab_id = str(test_collaboration["collaboration"]["id"])
 
         response = await client.post(
             f"/collaborations/{collab_id}/approve",
-            headers=get_auth_headers(other_creator["token"])
+            headers=shared_creator["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -489,7 +493,7 @@ class TestCancelCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={"reason": "Change of plans"},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -506,7 +510,7 @@ class TestCancelCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={"reason": "Fully booked"},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -522,7 +526,7 @@ class TestCancelCollaboration:
         response = await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -537,29 +541,28 @@ class TestCancelCollaboration:
         await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={},
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         # Try to cancel again
         response = await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={},
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 400
 
     async def test_non_participant_cannot_cancel(
-        self, client: AsyncClient, test_collaboration, cleanup_database, init_database
+        self, client: AsyncClient, test_collaboration, shared_creator
     ):
         """Test non-participant cannot cancel."""
-        other_creator = await create_test_creator()
         collab_id = str(test_collaboration["collaboration"]["id"])
 
         response = await client.post(
             f"/collaborations/{collab_id}/cancel",
             json={},
-            headers=get_auth_headers(other_creator["token"])
+            headers=shared_creator["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -574,27 +577,21 @@ class TestToggleDeliverable:
         """Test toggling deliverable completion status."""
         collab_id = str(test_collaboration["collaboration"]["id"])
 
-        # Get deliverable ID
-        deliverable = await Database.fetchrow(
-            "SELECT id FROM collaboration_deliverables WHERE collaboration_id = $1 LIMIT 1",
-            test_collaboration["collaboration"]["id"]
-        )
+        deliverable_id = await get_first_deliverable_id(test_collaboration["collaboration"]["id"])
 
         response = await client.post(
-            f"/collaborations/{collab_id}/deliverables/{deliverable['id']}/toggle",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            f"/collaborations/{collab_id}/deliverables/{deliverable_id}/toggle",
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        # Check that one deliverable has changed status
-        deliverable_found = False
-        for pd in data["platform_deliverables"]:
-            for d in pd["deliverables"]:
-                if d["id"] == str(deliverable["id"]):
-                    assert d["status"] == "completed"
-                    deliverable_found = True
-        assert deliverable_found
+        by_id = {
+            d["id"]: d
+            for pd in data["platform_deliverables"]
+            for d in pd["deliverables"]
+        }
+        assert by_id[str(deliverable_id)]["status"] == "completed"
 
     async def test_toggle_deliverable_back(
         self, client: AsyncClient, test_collaboration
@@ -602,29 +599,29 @@ class TestToggleDeliverable:
         """Test toggling deliverable back to pending."""
         collab_id = str(test_collaboration["collaboration"]["id"])
 
-        deliverable = await Database.fetchrow(
-            "SELECT id FROM collaboration_deliverables WHERE collaboration_id = $1 LIMIT 1",
-            test_collaboration["collaboration"]["id"]
-        )
+        deliverable_id = await get_first_deliverable_id(test_collaboration["collaboration"]["id"])
 
         # Toggle to completed
-        await client.post(
-            f"/collaborations/{collab_id}/deliverables/{deliverable['id']}/toggle",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+        first_response = await client.post(
+            f"/collaborations/{collab_id}/deliverables/{deliverable_id}/toggle",
+            headers=test_collaboration["creator"]["auth_headers"]
         )
+        assert first_response.status_code == 200
 
         # Toggle back to pending
         response = await client.post(
-            f"/collaborations/{collab_id}/deliverables/{deliverable['id']}/toggle",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            f"/collaborations/{collab_id}/deliverables/{deliverable_id}/toggle",
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        for pd in data["platform_deliverables"]:
-            for d in pd["deliverables"]:
-                if d["id"] == str(deliverable["id"]):
-                    assert d["status"] == "pending"
+        by_id = {
+            d["id"]: d
+            for pd in data["platform_deliverables"]
+            for d in pd["deliverables"]
+        }
+        assert by_id[str(deliverable_id)]["status"] == "pending"
 
     async def test_toggle_deliverable_not_found(
         self, client: AsyncClient, test_collaboration
@@ -634,7 +631,7 @@ class TestToggleDeliverable:
 
         response = await client.post(
             f"/collaborations/{collab_id}/deliverables/00000000-0000-0000-0000-000000000000/toggle",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -645,14 +642,11 @@ class TestToggleDeliverable:
         """Test hotel can toggle deliverable."""
         collab_id = str(test_collaboration["collaboration"]["id"])
 
-        deliverable = await Database.fetchrow(
-            "SELECT id FROM collaboration_deliverables WHERE collaboration_id = $1 LIMIT 1",
-            test_collaboration["collaboration"]["id"]
-        )
+        deliverable_id = await get_first_deliverable_id(test_collaboration["collaboration"]["id"])
 
         response = await client.post(
-            f"/collaborations/{collab_id}/deliverables/{deliverable['id']}/toggle",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            f"/collaborations/{collab_id}/deliverables/{deliverable_id}/toggle",
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -668,7 +662,7 @@ class TestCollaborationNotFound:
         response = await client.post(
             "/collaborations/00000000-0000-0000-0000-000000000000/respond",
             json={"status": "accepted"},
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -680,7 +674,7 @@ class TestCollaborationNotFound:
         response = await client.put(
             "/collaborations/00000000-0000-0000-0000-000000000000/terms",
             json={"stay_nights": 5},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -691,7 +685,7 @@ class TestCollaborationNotFound:
         """Test approving non-existent collaboration."""
         response = await client.post(
             "/collaborations/00000000-0000-0000-0000-000000000000/approve",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -703,7 +697,37 @@ class TestCollaborationNotFound:
         response = await client.post(
             "/collaborations/00000000-0000-0000-0000-000000000000/cancel",
             json={},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 404
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "party, path",
+    [
+        ("creator", "/creators/me/collaborations"),
+        ("creator", "/creators/me/collaborations/{collaboration_id}"),
+        ("hotel", "/hotels/me/collaborations"),
+        ("hotel", "/hotels/me/collaborations/{collaboration_id}"),
+    ],
+    ids=["creator_list", "creator_detail", "hotel_list", "hotel_detail"],
+)
+def test_collaboration_read_benchmark(
+    benchmark, event_loop, client: AsyncClient, shared_collaboration, party, path
+):
+    """Measure one read of the shared collaboration.
+
+    Seeding happens in shared_collaboration, so only the HTTP call is timed.
+    The test is sync because the benchmark fixture times a plain callable, and
+    the call is a GET so repeated runs under instrumentation see the same state.
+    """
+    url = path.format(collaboration_id=shared_collaboration["collaboration"]["id"])
+    headers = shared_collaboration[party]["auth_headers"]
+
+    response = benchmark(
+        lambda: event_loop.run_until_complete(client.get(url, headers=headers))
+    )
+
+    assert response.status_code == 200
@@ -1,28 +1,78 @@
 """
 Tests for creator profile endpoints.
 """
+import json
+import orjson
 import pytest
 from httpx import AsyncClient
 
-from app.database import Database
 from tests.conftest import (
-    get_auth_headers,
+    JSON_HEADERS,
     create_test_creator,
     create_test_hotel,
     create_test_platform,
+    create_test_rating,
 )
 
 
+# Analytics columns are JSONB text; serialized once for the whole module
+TOP_COUNTRIES_JSON = json.dumps([{"country": "USA", "percentage": 50}])
+TOP_AGE_GROUPS_JSON = json.dumps([{"ageRange": "25-34", "percentage": 60}])
+GENDER_SPLIT_JSON = json.dumps({"male": 50, "female": 50})
+
+# Larger PUT /creators/me bodies, encoded once and sent as raw content
+PLATFORMS_UPDATE_BODY = orjson.dumps({
+    "platforms": [
+        {
+            "name": "Instagram",
+            "handle": "@newhandle",
+            "followers": 75000,
+            "engagementRate": 4.2
+        },
+        {
+            "name": "TikTok",
+            "handle": "@tiktokhandle",
+            "followers": 150000,
+            "engagementRate": 6.5
+        }
+    ]
+})
+ANALYTICS_UPDATE_BODY = orjson.dumps({
+    "platforms": [
+        {
+            "name": "Instagram",
+            "handle": "@analytics_test",
+            "followers": 100000,
+            "engagementRate": 4.5,
+            "topCountries": [
+                {"country": "USA", "percentage": 45},
+                {"country": "UK", "percentage": 20}
+            ],
+            "topAgeGroups": [
+                {"ageRange": "25-34", "percentage": 40},
+                {"ageRange": "18-24", "percentage": 35}
+            ],
+            "genderSplit": {
+                "male": 40,
+                "female": 58,
+                "other": 2
+            }
+        }
+    ]
+})
+
+
 class TestGetCreatorProfileStatus:
     """Tests for GET /creators/me/profile-status"""
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_profile_status_complete(
-        self, client: AsyncClient, test_creator_verified
+        self, client: AsyncClient, shared_creator_verified
     ):
         """Test profile status for complete profile."""
         response = await client.get(
             "/creators/me/profile-status",
-            headers=get_auth_headers(test_creator_verified["token"])
+            headers=shared_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -31,8 +81,9 @@ class TestGetCreatorProfileStatus:
         assert len(data["missing_fields"]) == 0
         assert data["missing_platforms"] is False
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_profile_status_incomplete(
-        self, client: AsyncClient, cleanup_database, init_database
+        self, client: AsyncClient
     ):
         """Test profile status for incomplete profile."""
         # Create creator with missing fields
@@ -43,7 +94,7 @@ class TestGetCreatorProfileStatus:
 
         response = await client.get(
             "/creators/me/profile-status",
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -54,26 +105,53 @@ class TestGetCreatorProfileStatus:
         assert data["missing_platforms"] is True
         assert len(data["completion_steps"]) > 0
 
-    async def test_profile_status_missing_platforms(
-        self, client: AsyncClient, test_creator
+    @pytest.mark.usefixtures("db_transaction")
+    @pytest.mark.parametrize(
+        "creator_fields, platform_fields, missing_field, missing_platforms, step",
+        [
+            ({"name": "  "}, {}, "name", False, "Add your name"),
+            ({"location": None}, {}, "location", False, "Set your location"),
+            (
+                {"short_description": None}, {}, "short_description", False,
+                "Add a short description about yourself",
+            ),
+            ({}, None, None, True, "Add at least one social media platform"),
+            ({}, {"followers": 0}, None, True, "Add at least one social media platform"),
+            ({}, {"handle": " \t\n"}, None, True, "Add at least one social media platform"),
+        ],
+        ids=["missing_name", "missing_location", "missing_description",
+             "missing_platforms", "invalid_platform", "whitespace_handle"],
+    )
+    async def test_profile_status_missing(
+        self, client: AsyncClient,
+        creator_fields, platform_fields, missing_field, missing_platforms, step
     ):
-        """Test profile status when platforms are missing."""
+        """Test profile status reports each missing piece of the profile."""
+        creator = await create_test_creator(**creator_fields)
+        if platform_fields is not None:
+            await create_test_platform(
+                creator_id=str(creator["creator"]["id"]), **platform_fields
+            )
+
         response = await client.get(
             "/creators/me/profile-status",
-            headers=get_auth_headers(test_creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["missing_platforms"] is True
+        assert data["profile_complete"] is False
+        assert data["missing_fields"] == ([missing_field] if missing_field else [])
+        assert data["missing_platforms"] is missing_platforms
+        assert data["completion_steps"] == [step]
 
     async def test_profile_status_wrong_user_type(
-        self, client: AsyncClient, test_hotel
+        self, client: AsyncClient, shared_hotel
     ):
         """Test profile status as hotel user."""
         response = await client.get(
             "/creators/me/profile-status",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=shared_hotel["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -90,13 +168,14 @@ class TestGetCreatorProfileStatus:
 class TestGetCreatorProfile:
     """Tests for GET /creators/me"""
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_get_profile_success(
         self, client: AsyncClient, test_creator
     ):
         """Test getting creator profile."""
         response = await client.get(
             "/creators/me",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -106,13 +185,14 @@ class TestGetCreatorProfile:
         assert "platforms" in data
         assert "rating" in data
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_get_profile_with_platforms(
-        self, client: AsyncClient, test_creator_verified
+        self, client: AsyncClient, shared_creator_verified
     ):
         """Test getting profile with platforms."""
         response = await client.get(
             "/creators/me",
-            headers=get_auth_headers(test_creator_verified["token"])
+            headers=shared_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -123,16 +203,13 @@ class TestGetCreatorProfile:
         assert "handle" in platform
         assert "followers" in platform
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_get_profile_with_ratings(
         self, client: AsyncClient, test_creator_verified, test_hotel_verified
     ):
         """Test getting profile with ratings."""
         # Add a rating
-        await Database.execute(
-            """
-            INSERT INTO creator_ratings (creator_id, hotel_id, rating, comment)
-            VALUES ($1, $2, $3, $4)
-            """,
+        await create_test_rating(
             test_creator_verified["creator"]["id"],
             test_hotel_verified["hotel"]["id"],
             5,
@@ -141,7 +218,7 @@ class TestGetCreatorProfile:
 
         response = await client.get(
             "/creators/me",
-            headers=get_auth_headers(test_creator_verified["token"])
+            headers=test_creator_verified["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -158,12 +235,12 @@ class TestGetCreatorProfile:
         assert response.status_code == 403
 
     async def test_get_profile_wrong_user_type(
-        self, client: AsyncClient, test_hotel
+        self, client: AsyncClient, shared_hotel
     ):
         """Test getting creator profile as hotel user."""
         response = await client.get(
             "/creators/me",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=shared_hotel["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -183,14 +260,17 @@ class TestUpdateCreatorProfile:
                 "location": "Los Angeles, USA",
                 "shortDescription": "Updated description"
             },
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["name"] == "Updated Name"
-        assert data["location"] == "Los Angeles, USA"
-        assert data["short_description"] == "Updated description"
+        expected = {
+            "name": "Updated Name",
+            "location": "Los Angeles, USA",
+            "short_description": "Updated description"
+        }
+        assert {key: data[key] for key in expected} == expected
 
     async def test_update_profile_with_platforms(
         self, client: AsyncClient, test_creator
@@ -198,23 +278,8 @@ class TestUpdateCreatorProfile:
         """Test updating profile with platforms."""
         response = await client.put(
             "/creators/me",
-            json={
-                "platforms": [
-                    {
-                        "name": "Instagram",
-                        "handle": "@newhandle",
-                        "followers": 75000,
-                        "engagementRate": 4.2
-                    },
-                    {
-                        "name": "TikTok",
-                        "handle": "@tiktokhandle",
-                        "followers": 150000,
-                        "engagementRate": 6.5
-                    }
-                ]
-            },
-            headers=get_auth_headers(test_creator["token"])
+            content=PLATFORMS_UPDATE_BODY,
+            headers={**test_creator["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 200
@@ -223,7 +288,7 @@ class TestUpdateCreatorProfile:
         assert data["audience_size"] == 225000  # 75000 + 150000
 
     async def test_update_platforms_replaces_existing(
-        self, client: AsyncClient, cleanup_database, init_database
+        self, client: AsyncClient, db_transaction
     ):
         """Test that updating platforms replaces all existing ones."""
         creator = await create_test_creator()
@@ -248,7 +313,7 @@ class TestUpdateCreatorProfile:
                     }
                 ]
             },
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -258,7 +323,7 @@ class TestUpdateCreatorProfile:
         assert data["platforms"][0]["name"] == "TikTok"
 
     async def test_update_profile_completion_email(
-        self, client: AsyncClient, cleanup_database, init_database, mock_send_email
+        self, client: AsyncClient, db_transaction, mock_send_email
     ):
         """Test that completion email is sent when profile becomes complete."""
         creator = await create_test_creator(
@@ -282,57 +347,46 @@ class TestUpdateCreatorProfile:
                     }
                 ]
             },
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
 
-    async def test_update_profile_partial(
-        self, client: AsyncClient, test_creator
+    @pytest.mark.usefixtures("db_transaction")
+    @pytest.mark.parametrize(
+        "body, key, expected",
+        [
+            ({"name": "Only Name Updated"}, "name", "Only Name Updated"),
+            (
+                {"profilePicture": "https://example.com/new-picture.jpg"},
+                "profile_picture",
+                "https://example.com/new-picture.jpg",
+            ),
+            (
+                {"portfolioLink": "https://portfolio.example.com"},
+                "portfolio_link",
+                # Normalized with a trailing slash by the URL type
+                "https://portfolio.example.com/",
+            ),
+        ],
+        ids=["name", "profile_picture", "portfolio_link"],
+    )
+    async def test_update_profile_single_field(
+        self, client: AsyncClient, test_creator, body, key, expected
     ):
-        """Test partial profile update."""
-        # Update only name
+        """Test partial profile updates that set a single field."""
         response = await client.put(
             "/creators/me",
-            json={"name": "Only Name Updated"},
-            headers=get_auth_headers(test_creator["token"])
+            json=body,
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["name"] == "Only Name Updated"
+        assert data[key] == expected
         # Other fields should remain
         assert data["location"] == test_creator["creator"]["location"]
 
-    async def test_update_profile_picture(
-        self, client: AsyncClient, test_creator
-    ):
-        """Test updating profile picture URL."""
-        response = await client.put(
-            "/creators/me",
-            json={"profilePicture": "https://example.com/new-picture.jpg"},
-            headers=get_auth_headers(test_creator["token"])
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["profile_picture"] == "https://example.com/new-picture.jpg"
-
-    async def test_update_profile_portfolio_link(
-        self, client: AsyncClient, test_creator
-    ):
-        """Test updating portfolio link."""
-        response = await client.put(
-            "/creators/me",
-            json={"portfolioLink": "https://portfolio.example.com"},
-            headers=get_auth_headers(test_creator["token"])
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        # URL may be normalized with trailing slash
-        assert data["portfolio_link"].rstrip("/") == "https://portfolio.example.com"
-
     async def test_update_profile_no_auth(
         self, client: AsyncClient
     ):
@@ -349,46 +403,48 @@ class TestGetCreatorCollaborations:
     """Tests for GET /creators/me/collaborations"""
 
     async def test_get_collaborations_list(
-        self, client: AsyncClient, test_collaboration
+        self, client: AsyncClient, shared_collaboration
     ):
         """Test getting creator collaborations list."""
         response = await client.get(
             "/creators/me/collaborations",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=shared_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 1
+        assert str(shared_collaboration["collaboration"]["id"]) in {collab["id"] for collab in data}
 
     async def test_get_collaborations_filter_by_status(
-        self, client: AsyncClient, test_collaboration
+        self, client: AsyncClient, shared_collaboration
     ):
         """Test filtering collaborations by status."""
         response = await client.get(
             "/creators/me/collaborations?status=pending",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=shared_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
         for collab in data:
             assert collab["status"] == "pending"
+        assert str(shared_collaboration["collaboration"]["id"]) in {collab["id"] for collab in data}
 
     async def test_get_collaborations_filter_by_initiator(
-        self, client: AsyncClient, test_collaboration
+        self, client: AsyncClient, shared_collaboration
     ):
         """Test filtering collaborations by initiator."""
         response = await client.get(
             "/creators/me/collaborations?initiated_by=creator",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=shared_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
         for collab in data:
             assert collab["initiator_type"] == "creator"
+        assert str(shared_collaboration["collaboration"]["id"]) in {collab["id"] for collab in data}
 
     async def test_get_collaborations_empty(
         self, client: AsyncClient, test_creator
@@ -396,7 +452,7 @@ class TestGetCreatorCollaborations:
         """Test getting collaborations when none exist."""
         response = await client.get(
             "/creators/me/collaborations",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -423,7 +479,7 @@ class TestGetCreatorCollaborationDetail:
 
         response = await client.get(
             f"/creators/me/collaborations/{collab_id}",
-            headers=get_auth_headers(test_collaboration["creator"]["token"])
+            headers=test_collaboration["creator"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -434,17 +490,14 @@ class TestGetCreatorCollaborationDetail:
         assert "platform_deliverables" in data
 
     async def test_get_collaboration_detail_not_participant(
-        self, client: AsyncClient, test_collaboration, cleanup_database, init_database
+        self, client: AsyncClient, test_collaboration, shared_creator
     ):
         """Test getting collaboration detail as non-participant."""
-        # Create another creator
-        other_creator = await create_test_creator()
-
         collab_id = str(test_collaboration["collaboration"]["id"])
 
         response = await client.get(
             f"/creators/me/collaborations/{collab_id}",
-            headers=get_auth_headers(other_creator["token"])
+            headers=shared_creator["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -455,7 +508,7 @@ class TestGetCreatorCollaborationDetail:
         """Test getting non-existent collaboration."""
         response = await client.get(
             "/creators/me/collaborations/00000000-0000-0000-0000-000000000000",
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -468,7 +521,7 @@ class TestGetCreatorCollaborationDetail:
 
         response = await client.get(
             f"/creators/me/collaborations/{collab_id}",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 403
@@ -483,30 +536,8 @@ class TestPlatformAnalytics:
         """Test updating platform with full analytics data."""
         response = await client.put(
             "/creators/me",
-            json={
-                "platforms": [
-                    {
-                        "name": "Instagram",
-                        "handle": "@analytics_test",
-                        "followers": 100000,
-                        "engagementRate": 4.5,
-                        "topCountries": [
-                            {"country": "USA", "percentage": 45},
-                            {"country": "UK", "percentage": 20}
-                        ],
-                        "topAgeGroups": [
-                            {"ageRange": "25-34", "percentage": 40},
-                            {"ageRange": "18-24", "percentage": 35}
-                        ],
-                        "genderSplit": {
-                            "male": 40,
-                            "female": 58,
-                            "other": 2
-                        }
-                    }
-                ]
-            },
-            headers=get_auth_headers(test_creator["token"])
+            content=ANALYTICS_UPDATE_BODY,
+            headers={**test_creator["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 200
@@ -517,33 +548,23 @@ class TestPlatformAnalytics:
         assert platform["gender_split"] is not None
 
     async def test_get_profile_includes_analytics(
-        self, client: AsyncClient, cleanup_database, init_database
+        self, client: AsyncClient, db_transaction
     ):
         """Test that getting profile includes platform analytics."""
-        import json
-
         creator = await create_test_creator()
 
         # Add platform with analytics
-        await Database.execute(
-            """
-            INSERT INTO creator_platforms
-            (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            """,
-            creator["creator"]["id"],
-            "Instagram",
-            "@test",
-            50000,
-            3.5,
-            json.dumps([{"country": "USA", "percentage": 50}]),
-            json.dumps([{"ageRange": "25-34", "percentage": 60}]),
-            json.dumps({"male": 50, "female": 50})
+        await create_test_platform(
+            creator_id=creator["creator"]["id"],
+            handle="@test",
+            top_countries=TOP_COUNTRIES_JSON,
+            top_age_groups=TOP_AGE_GROUPS_JSON,
+            gender_split=GENDER_SPLIT_JSON
         )
 
         response = await client.get(
             "/creators/me",
-            headers=get_auth_headers(creator["token"])
+            headers=creator["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -1,6 +1,7 @@
 """
 Tests for hotel profile and listing endpoints.
 """
+import orjson
 import pytest
 from httpx import AsyncClient
 from io import BytesIO
@@ -8,14 +9,155 @@ from PIL import Image
 
 from app.database import Database
 from tests.conftest import (
-    get_auth_headers,
+    JSON_HEADERS,
     create_test_hotel,
-    create_test_creator,
+    create_test_hotel_profile,
     create_test_listing,
-    create_test_collaboration,
+    generate_test_email,
 )
 
 
+# Listing bodies for POST /hotels/me/listings, encoded once and sent as raw content
+OCEAN_VIEW_LISTING_BODY = orjson.dumps({
+    "name": "Ocean View Suite",
+    "location": "Maldives",
+    "description": "Beautiful ocean view suite with panoramic views",
+    "accommodationType": "Luxury Hotel",
+    "images": ["https://example.com/image1.jpg"],
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Free Stay",
+            "availabilityMonths": ["January", "February", "March"],
+            "platforms": ["Instagram", "TikTok"],
+            "freeStayMinNights": 3,
+            "freeStayMaxNights": 7
+        }
+    ],
+    "creatorRequirements": {
+        "platforms": ["Instagram"],
+        "minFollowers": 10000,
+        "topCountries": ["USA", "UK"],
+        "targetAgeGroups": ["25-34"]
+    }
+})
+PAID_OFFERING_LISTING_BODY = orjson.dumps({
+    "name": "Paid Collaboration Suite",
+    "location": "Paris, France",
+    "description": "Luxury suite in the heart of Paris with stunning views",
+    "accommodationType": "Luxury Hotel",
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Paid",
+            "availabilityMonths": ["April", "May", "June"],
+            "platforms": ["Instagram"],
+            "paidMaxAmount": 5000
+        }
+    ],
+    "creatorRequirements": {
+        "platforms": ["Instagram"],
+        "minFollowers": 50000
+    }
+})
+WRONG_USER_TYPE_LISTING_BODY = orjson.dumps({
+    "name": "Test Listing",
+    "location": "Test Location",
+    "description": "Test description for this listing",
+    "accommodationType": "Hotel",
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Free Stay",
+            "availabilityMonths": ["January"],
+            "platforms": ["Instagram"],
+            "freeStayMinNights": 2,
+            "freeStayMaxNights": 5
+        }
+    ],
+    "creatorRequirements": {"platforms": ["Instagram"], "minFollowers": 1000}
+})
+MULTI_OFFERING_LISTING_BODY = orjson.dumps({
+    "name": "Multi-Offering Suite",
+    "location": "Dubai",
+    "description": "Luxury suite with stunning views of the city skyline",
+    "accommodationType": "Luxury Hotel",
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Free Stay",
+            "availabilityMonths": ["March", "April"],
+            "platforms": ["Instagram"],
+            "freeStayMinNights": 3,
+            "freeStayMaxNights": 5
+        },
+        {
+            "collaborationType": "Paid",
+            "availabilityMonths": ["May", "June"],
+            "platforms": ["TikTok"],
+            "paidMaxAmount": 2000
+        }
+    ],
+    "creatorRequirements": {
+        "platforms": ["Instagram", "TikTok"],
+        "minFollowers": 25000
+    }
+})
+SEASONAL_LISTING_BODY = orjson.dumps({
+    "name": "Seasonal Suite",
+    "location": "Alps",
+    "description": "Winter suite with breathtaking mountain views",
+    "accommodationType": "Lodge",
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Free Stay",
+            "platforms": ["Instagram"],
+            "availabilityMonths": ["December", "January", "February"],
+            "freeStayMinNights": 5,
+            "freeStayMaxNights": 10
+        }
+    ],
+    "creatorRequirements": {
+        "platforms": ["Instagram"],
+        "minFollowers": 50000
+    }
+})
+AGE_REQUIREMENTS_LISTING_BODY = orjson.dumps({
+    "name": "Youth Focused Hotel",
+    "location": "Ibiza",
+    "description": "Party destination with amazing nightlife and beach access",
+    "accommodationType": "Hotel",
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Free Stay",
+            "availabilityMonths": ["July", "August"],
+            "platforms": ["TikTok"],
+            "freeStayMinNights": 2,
+            "freeStayMaxNights": 4
+        }
+    ],
+    "creatorRequirements": {
+        "platforms": ["TikTok"],
+        "minFollowers": 100000,
+        "targetAgeMin": 18,
+        "targetAgeMax": 30,
+        "targetAgeGroups": ["18-24", "25-34"]
+    }
+})
+
+
+# A well-formed listing id that no row uses
+MISSING_LISTING_ID = "00000000-0000-0000-0000-000000000000"
+
+# Body for PUT /hotels/me/listings/{listing_id}
+DISCOUNT_OFFERINGS_UPDATE_BODY = orjson.dumps({
+    "collaborationOfferings": [
+        {
+            "collaborationType": "Discount",
+            "availabilityMonths": ["July", "August"],
+            "platforms": ["Instagram"],
+            "discountPercentage": 50
+        }
+    ]
+})
+
+
 def create_test_image() -> bytes:
     """Create a test image."""
     img = Image.new("RGB", (100, 100), color="blue")
@@ -28,81 +170,59 @@ def create_test_image() -> bytes:
 class TestGetHotelProfileStatus:
     """Tests for GET /hotels/me/profile-status"""
 
-    async def test_profile_status_complete(
-        self, client: AsyncClient, test_hotel_verified
-    ):
-        """Test profile status for complete hotel profile."""
-        response = await client.get(
-            "/hotels/me/profile-status",
-            headers=get_auth_headers(test_hotel_verified["token"])
-        )
+    @pytest.mark.usefixtures("db_transaction")
+    @pytest.mark.parametrize(
+        "hotel_fields, with_listing, missing_fields, default_location, steps",
+        [
+            ({"profile_complete": True}, True, [], False, []),
+            (
+                {"location": "Not specified"}, True, [], True,
+                ["Set a custom location (currently using default)"],
+            ),
+            ({"hotel_name": "  "}, True, ["name"], False, ["Update your hotel name"]),
+            (
+                {"about": None, "website": ""}, True, ["about", "website"], False,
+                ["Add a description about your hotel", "Add your website URL"],
+            ),
+            ({}, False, [], False, ["Add at least one property listing"]),
+        ],
+        ids=["complete", "default_location", "empty_name", "missing_about_website", "missing_listings"],
+    )
+    async def test_profile_status(
+        self, client: AsyncClient, shared_hotel_user,
+        hotel_fields, with_listing, missing_fields, default_location, steps
+    ):
+        """Test profile status reports each missing or defaulted piece of the profile."""
+        hotel = await create_test_hotel_profile(shared_hotel_user, **hotel_fields)
+        if with_listing:
+            await create_test_listing(hotel_profile_id=str(hotel["hotel"]["id"]))
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["profile_complete"] is True
-        assert len(data["missing_fields"]) == 0
-        assert data["missing_listings"] is False
-
-    async def test_profile_status_incomplete(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test profile status for incomplete hotel profile."""
         response = await client.get(
             "/hotels/me/profile-status",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=hotel["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["profile_complete"] is False
-        assert data["missing_listings"] is True
-        assert len(data["completion_steps"]) > 0
-
-    async def test_profile_status_has_defaults(
-        self, client: AsyncClient, cleanup_database, init_database
-    ):
-        """Test profile status with default location."""
-        hotel = await create_test_hotel(location="Not specified")
-
-        response = await client.get(
-            "/hotels/me/profile-status",
-            headers=get_auth_headers(hotel["token"])
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["has_defaults"]["location"] is True
-
-    async def test_profile_status_wrong_user_type(
-        self, client: AsyncClient, test_creator
-    ):
-        """Test profile status as creator user."""
-        response = await client.get(
-            "/hotels/me/profile-status",
-            headers=get_auth_headers(test_creator["token"])
-        )
-
-        assert response.status_code == 403
-
-    async def test_profile_status_no_auth(
-        self, client: AsyncClient
-    ):
-        """Test profile status without authentication."""
-        response = await client.get("/hotels/me/profile-status")
-
-        assert response.status_code == 403
+        # Complete exactly when there is nothing left to do
+        assert data["profile_complete"] is (not steps)
+        assert data["missing_fields"] == missing_fields
+        assert data["has_defaults"]["location"] is default_location
+        assert data["missing_listings"] is not with_listing
+        assert data["completion_steps"] == steps
 
 
 class TestGetHotelProfile:
     """Tests for GET /hotels/me"""
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_get_profile_success(
         self, client: AsyncClient, test_hotel
     ):
         """Test getting hotel profile."""
         response = await client.get(
             "/hotels/me",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -111,13 +231,14 @@ class TestGetHotelProfile:
         assert data["email"] == test_hotel["user"]["email"]
         assert "listings" in data
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_get_profile_with_listings(
-        self, client: AsyncClient, test_hotel_verified
+        self, client: AsyncClient, shared_hotel_verified
     ):
         """Test getting profile with listings."""
         response = await client.get(
             "/hotels/me",
-            headers=get_auth_headers(test_hotel_verified["token"])
+            headers=shared_hotel_verified["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -128,37 +249,76 @@ class TestGetHotelProfile:
         assert "collaboration_offerings" in listing
         assert "creator_requirements" in listing
 
-    async def test_get_profile_no_auth(
-        self, client: AsyncClient
-    ):
-        """Test getting profile without authentication."""
-        response = await client.get("/hotels/me")
-
-        assert response.status_code == 403
-
 
+class TestHotelAuthGuards:
+    """Auth and ownership guards shared by the /hotels/me endpoints"""
+
+    @pytest.mark.parametrize(
+        "method, path, user, status_code",
+        [
+            ("GET", "/hotels/me/profile-status", None, 403),
+            ("GET", "/hotels/me/profile-status", "creator", 403),
+            ("GET", "/hotels/me", None, 403),
+            ("PUT", f"/hotels/me/listings/{MISSING_LISTING_ID}", "hotel", 404),
+            ("DELETE", f"/hotels/me/listings/{MISSING_LISTING_ID}", "hotel", 404),
+        ],
+        ids=[
+            "profile_status_no_auth",
+            "profile_status_wrong_user_type",
+            "get_profile_no_auth",
+            "update_listing_not_found",
+            "delete_listing_not_found",
+        ],
+    )
+    async def test_guard(
+        self, client: AsyncClient, shared_hotel, shared_creator,
+        method, path, user, status_code
+    ):
+        """Test the endpoint rejects the request before touching any owned rows."""
+        users = {"hotel": shared_hotel, "creator": shared_creator}
+        response = await client.request(
+            method,
+            path,
+            json={"name": "Test"} if method == "PUT" else None,
+            headers=users[user]["auth_headers"] if user else None
+        )
+
+        assert response.status_code == status_code
+
+
+@pytest.mark.usefixtures("db_transaction")
 class TestUpdateHotelProfile:
     """Tests for PUT /hotels/me"""
 
-    async def test_update_profile_json(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test updating profile with JSON body."""
-        response = await client.put(
-            "/hotels/me",
-            json={
+    @pytest.mark.parametrize(
+        "update",
+        [
+            {
                 "name": "Updated Hotel Name",
                 "location": "Rome, Italy",
                 "about": "A beautiful hotel in Rome"
             },
-            headers=get_auth_headers(test_hotel["token"])
+            {"phone": "+1234567890"},
+            {"email": generate_test_email("newemail")},
+        ],
+        ids=["json", "partial", "email"],
+    )
+    async def test_update_profile_fields(
+        self, client: AsyncClient, test_hotel, update
+    ):
+        """Test updating profile fields with a JSON body."""
+        response = await client.put(
+            "/hotels/me",
+            json=update,
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["name"] == "Updated Hotel Name"
-        assert data["location"] == "Rome, Italy"
-        assert data["about"] == "A beautiful hotel in Rome"
+        assert {key: data[key] for key in update} == update
+        if "name" not in update:
+            # Other fields should remain unchanged
+            assert data["name"] == test_hotel["hotel"]["name"]
 
     async def test_update_profile_multipart(
         self, client: AsyncClient, test_hotel
@@ -173,7 +333,7 @@ class TestUpdateHotelProfile:
                 "location": "Barcelona, Spain"
             },
             files={"picture": ("hotel.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -182,7 +342,7 @@ class TestUpdateHotelProfile:
         assert data["picture"] is not None
 
     async def test_update_profile_completion_email(
-        self, client: AsyncClient, cleanup_database, init_database, mock_send_email
+        self, client: AsyncClient, mock_send_email
     ):
         """Test that completion email is sent when profile becomes complete."""
         hotel = await create_test_hotel(
@@ -200,77 +360,24 @@ class TestUpdateHotelProfile:
                 "about": "Complete description",
                 "website": "https://hotel.example.com"
             },
-            headers=get_auth_headers(hotel["token"])
+            headers=hotel["auth_headers"]
         )
 
         assert response.status_code == 200
 
-    async def test_update_profile_partial(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test partial profile update."""
-        response = await client.put(
-            "/hotels/me",
-            json={"phone": "+1234567890"},
-            headers=get_auth_headers(test_hotel["token"])
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["phone"] == "+1234567890"
-        # Other fields should remain unchanged
-        assert data["name"] == test_hotel["hotel"]["name"]
-
-    async def test_update_email(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test updating email."""
-        from tests.conftest import generate_test_email
-        new_email = generate_test_email("newemail")
-
-        response = await client.put(
-            "/hotels/me",
-            json={"email": new_email},
-            headers=get_auth_headers(test_hotel["token"])
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["email"] == new_email
-
 
 class TestCreateHotelListing:
     """Tests for POST /hotels/me/listings"""
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_create_listing_success(
         self, client: AsyncClient, test_hotel
     ):
         """Test creating a listing."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Ocean View Suite",
-                "location": "Maldives",
-                "description": "Beautiful ocean view suite with panoramic views",
-                "accommodationType": "Luxury Hotel",
-                "images": ["https://example.com/image1.jpg"],
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Free Stay",
-                        "availabilityMonths": ["January", "February", "March"],
-                        "platforms": ["Instagram", "TikTok"],
-                        "freeStayMinNights": 3,
-                        "freeStayMaxNights": 7
-                    }
-                ],
-                "creatorRequirements": {
-                    "platforms": ["Instagram"],
-                    "minFollowers": 10000,
-                    "topCountries": ["USA", "UK"],
-                    "targetAgeGroups": ["25-34"]
-                }
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            content=OCEAN_VIEW_LISTING_BODY,
+            headers={**test_hotel["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 201
@@ -279,31 +386,15 @@ class TestCreateHotelListing:
         assert len(data["collaboration_offerings"]) == 1
         assert data["creator_requirements"] is not None
 
+    @pytest.mark.usefixtures("db_transaction")
     async def test_create_listing_with_paid_offering(
         self, client: AsyncClient, test_hotel
     ):
         """Test creating listing with paid collaboration."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Paid Collaboration Suite",
-                "location": "Paris, France",
-                "description": "Luxury suite in the heart of Paris with stunning views",
-                "accommodationType": "Luxury Hotel",
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Paid",
-                        "availabilityMonths": ["April", "May", "June"],
-                        "platforms": ["Instagram"],
-                        "paidMaxAmount": 5000
-                    }
-                ],
-                "creatorRequirements": {
-                    "platforms": ["Instagram"],
-                    "minFollowers": 50000
-                }
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            content=PAID_OFFERING_LISTING_BODY,
+            headers={**test_hotel["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 201
@@ -314,7 +405,7 @@ class TestCreateHotelListing:
         assert float(offering["paid_max_amount"]) == 5000
 
     async def test_create_listing_missing_fields(
-        self, client: AsyncClient, test_hotel
+        self, client: AsyncClient, stub_current_user
     ):
         """Test creating listing with missing required fields."""
         response = await client.post(
@@ -322,40 +413,25 @@ class TestCreateHotelListing:
             json={
                 "name": "Incomplete Listing"
                 # Missing other required fields
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            }
         )
 
         assert response.status_code == 422
 
     async def test_create_listing_wrong_user_type(
-        self, client: AsyncClient, test_creator
+        self, client: AsyncClient, shared_creator
     ):
         """Test creating listing as creator."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Test Listing",
-                "location": "Test Location",
-                "description": "Test description for this listing",
-                "accommodationType": "Hotel",
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Free Stay",
-                        "availabilityMonths": ["January"],
-                        "platforms": ["Instagram"],
-                        "freeStayMinNights": 2,
-                        "freeStayMaxNights": 5
-                    }
-                ],
-                "creatorRequirements": {"platforms": ["Instagram"], "minFollowers": 1000}
-            },
-            headers=get_auth_headers(test_creator["token"])
+            content=WRONG_USER_TYPE_LISTING_BODY,
+            headers={**shared_creator["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 403
 
 
+@pytest.mark.usefixtures("db_transaction")
 class TestUpdateHotelListing:
     """Tests for PUT /hotels/me/listings/{listing_id}"""
 
@@ -371,7 +447,7 @@ class TestUpdateHotelListing:
                 "name": "Updated Listing Name",
                 "description": "Updated description"
             },
-            headers=get_auth_headers(test_hotel_verified["token"])
+            headers=test_hotel_verified["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -386,17 +462,8 @@ class TestUpdateHotelListing:
 
         response = await client.put(
             f"/hotels/me/listings/{listing_id}",
-            json={
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Discount",
-                        "availabilityMonths": ["July", "August"],
-                        "platforms": ["Instagram"],
-                        "discountPercentage": 50
-                    }
-                ]
-            },
-            headers=get_auth_headers(test_hotel_verified["token"])
+            content=DISCOUNT_OFFERINGS_UPDATE_BODY,
+            headers={**test_hotel_verified["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 200
@@ -405,33 +472,21 @@ class TestUpdateHotelListing:
         assert data["collaboration_offerings"][0]["discount_percentage"] == 50
 
     async def test_update_listing_not_owner(
-        self, client: AsyncClient, test_hotel_verified, cleanup_database, init_database
+        self, client: AsyncClient, shared_hotel_verified, shared_hotel
     ):
         """Test updating listing as different hotel."""
-        other_hotel = await create_test_hotel()
-        listing_id = str(test_hotel_verified["listing"]["listing"]["id"])
+        listing_id = str(shared_hotel_verified["listing"]["listing"]["id"])
 
         response = await client.put(
             f"/hotels/me/listings/{listing_id}",
             json={"name": "Hacked Name"},
-            headers=get_auth_headers(other_hotel["token"])
+            headers=shared_hotel["auth_headers"]
         )
 
         assert response.status_code == 404  # Not found because it doesn't belong to them
 
-    async def test_update_listing_not_found(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test updating non-existent listing."""
-        response = await client.put(
-            "/hotels/me/listings/00000000-0000-0000-0000-000000000000",
-            json={"name": "Test"},
-            headers=get_auth_headers(test_hotel["token"])
-        )
-
-        assert response.status_code == 404
-
 
+@pytest.mark.usefixtures("db_transaction")
 class TestDeleteHotelListing:
     """Tests for DELETE /hotels/me/listings/{listing_id}"""
 
@@ -443,39 +498,26 @@ class TestDeleteHotelListing:
 
         response = await client.delete(
             f"/hotels/me/listings/{listing_id}",
-            headers=get_auth_headers(test_hotel_verified["token"])
+            headers=test_hotel_verified["auth_headers"]
         )
 
         assert response.status_code == 204
 
         # Verify listing is deleted
-        listing = await Database.fetchrow(
-            "SELECT id FROM hotel_listings WHERE id = $1",
+        assert not await Database.fetchval(
+            "SELECT EXISTS(SELECT 1 FROM hotel_listings WHERE id = $1)",
             test_hotel_verified["listing"]["listing"]["id"]
         )
-        assert listing is None
-
-    async def test_delete_listing_not_found(
-        self, client: AsyncClient, test_hotel
-    ):
-        """Test deleting non-existent listing."""
-        response = await client.delete(
-            "/hotels/me/listings/00000000-0000-0000-0000-000000000000",
-            headers=get_auth_headers(test_hotel["token"])
-        )
-
-        assert response.status_code == 404
 
     async def test_delete_listing_not_owner(
-        self, client: AsyncClient, test_hotel_verified, cleanup_database, init_database
+        self, client: AsyncClient, shared_hotel_verified, shared_hotel
     ):
         """Test deleting listing as different hotel."""
-        other_hotel = await create_test_hotel()
-        listing_id = str(test_hotel_verified["listing"]["listing"]["id"])
+        listing_id = str(shared_hotel_verified["listing"]["listing"]["id"])
 
         response = await client.delete(
             f"/hotels/me/listings/{listing_id}",
-            headers=get_auth_headers(other_hotel["token"])
+            headers=shared_hotel["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -490,7 +532,7 @@ class TestGetHotelCollaborations:
         """Test getting hotel collaborations list."""
         response = await client.get(
             "/hotels/me/collaborations",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -504,7 +546,7 @@ class TestGetHotelCollaborations:
         """Test filtering collaborations by status."""
         response = await client.get(
             "/hotels/me/collaborations?status=pending",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -520,7 +562,7 @@ class TestGetHotelCollaborations:
 
         response = await client.get(
             f"/hotels/me/collaborations?listing_id={listing_id}",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -533,7 +575,7 @@ class TestGetHotelCollaborations:
         """Test filtering collaborations by initiator."""
         response = await client.get(
             "/hotels/me/collaborations?initiated_by=creator",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -547,7 +589,7 @@ class TestGetHotelCollaborations:
         """Test getting collaborations when none exist."""
         response = await client.get(
             "/hotels/me/collaborations",
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -566,7 +608,7 @@ class TestGetHotelCollaborationDetail:
 
         response = await client.get(
             f"/hotels/me/collaborations/{collab_id}",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -577,16 +619,14 @@ class TestGetHotelCollaborationDetail:
         assert "platform_deliverables" in data
 
     async def test_get_collaboration_detail_not_participant(
-        self, client: AsyncClient, test_collaboration, cleanup_database, init_database
+        self, client: AsyncClient, test_collaboration, shared_hotel
     ):
         """Test getting collaboration detail as non-participant."""
-        other_hotel = await create_test_hotel()
-
         collab_id = str(test_collaboration["collaboration"]["id"])
 
         response = await client.get(
             f"/hotels/me/collaborations/{collab_id}",
-            headers=get_auth_headers(other_hotel["token"])
+            headers=shared_hotel["auth_headers"]
         )
 
         assert response.status_code == 404
@@ -599,7 +639,7 @@ class TestGetHotelCollaborationDetail:
 
         response = await client.get(
             f"/hotels/me/collaborations/{collab_id}",
-            headers=get_auth_headers(test_collaboration["hotel"]["token"])
+            headers=test_collaboration["hotel"]["auth_headers"]
         )
 
         assert response.status_code == 200
@@ -609,6 +649,7 @@ class TestGetHotelCollaborationDetail:
         assert "platforms" in data
 
 
+@pytest.mark.usefixtures("db_transaction")
 class TestListingCollaborationOfferings:
     """Tests for listing collaboration offerings"""
 
@@ -618,32 +659,8 @@ class TestListingCollaborationOfferings:
         """Test creating listing with multiple collaboration offerings."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Multi-Offering Suite",
-                "location": "Dubai",
-                "description": "Luxury suite with stunning views of the city skyline",
-                "accommodationType": "Luxury Hotel",
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Free Stay",
-                        "availabilityMonths": ["March", "April"],
-                        "platforms": ["Instagram"],
-                        "freeStayMinNights": 3,
-                        "freeStayMaxNights": 5
-                    },
-                    {
-                        "collaborationType": "Paid",
-                        "availabilityMonths": ["May", "June"],
-                        "platforms": ["TikTok"],
-                        "paidMaxAmount": 2000
-                    }
-                ],
-                "creatorRequirements": {
-                    "platforms": ["Instagram", "TikTok"],
-                    "minFollowers": 25000
-                }
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            content=MULTI_OFFERING_LISTING_BODY,
+            headers={**test_hotel["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 201
@@ -656,26 +673,8 @@ class TestListingCollaborationOfferings:
         """Test creating listing with availability months."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Seasonal Suite",
-                "location": "Alps",
-                "description": "Winter suite with breathtaking mountain views",
-                "accommodationType": "Lodge",
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Free Stay",
-                        "platforms": ["Instagram"],
-                        "availabilityMonths": ["December", "January", "February"],
-                        "freeStayMinNights": 5,
-                        "freeStayMaxNights": 10
-                    }
-                ],
-                "creatorRequirements": {
-                    "platforms": ["Instagram"],
-                    "minFollowers": 50000
-                }
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            content=SEASONAL_LISTING_BODY,
+            headers={**test_hotel["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 201
@@ -684,6 +683,7 @@ class TestListingCollaborationOfferings:
         assert offering["availability_months"] == ["December", "January", "February"]
 
 
+@pytest.mark.usefixtures("db_transaction")
 class TestCreatorRequirements:
     """Tests for listing creator requirements"""
 
@@ -693,29 +693,8 @@ class TestCreatorRequirements:
         """Test creating listing with age range requirements."""
         response = await client.post(
             "/hotels/me/listings",
-            json={
-                "name": "Youth Focused Hotel",
-                "location": "Ibiza",
-                "description": "Party destination with amazing nightlife and beach access",
-                "accommodationType": "Hotel",
-                "collaborationOfferings": [
-                    {
-                        "collaborationType": "Free Stay",
-                        "availabilityMonths": ["July", "August"],
-                        "platforms": ["TikTok"],
-                        "freeStayMinNights": 2,
-                        "freeStayMaxNights": 4
-                    }
-                ],
-                "creatorRequirements": {
-                    "platforms": ["TikTok"],
-                    "minFollowers": 100000,
-                    "targetAgeMin": 18,
-                    "targetAgeMax": 30,
-                    "targetAgeGroups": ["18-24", "25-34"]
-                }
-            },
-            headers=get_auth_headers(test_hotel["token"])
+            content=AGE_REQUIREMENTS_LISTING_BODY,
+            headers={**test_hotel["auth_headers"], **JSON_HEADERS}
         )
 
         assert response.status_code == 201
@@ -5,12 +5,12 @@ import pytest
 from httpx import AsyncClient
 import json
 
-from app.database import Database
 from tests.conftest import (
     create_test_creator,
     create_test_hotel,
     create_test_listing,
     create_test_platform,
+    create_test_rating,
 )
 
 
@@ -145,7 +145,7 @@ class TestGetMarketplaceListings:
         assert str(unverified_listing["listing"]["id"]) not in listing_ids
 
     async def test_listings_public_no_auth_required(
-        self, client: AsyncClient
+        self, client: AsyncClient, init_database
     ):
         """Test that marketplace listings are public."""
         response = await client.get("/marketplace/listings")
@@ -300,11 +300,7 @@ class TestGetMarketplaceCreators:
     ):
         """Test that creators include rating information."""
         # Add a rating
-        await Database.execute(
-            """
-            INSERT INTO creator_ratings (creator_id, hotel_id, rating, comment)
-            VALUES ($1, $2, $3, $4)
-            """,
+        await create_test_rating(
             test_creator_verified["creator"]["id"],
             test_hotel_verified["hotel"]["id"],
             4.5,
@@ -322,7 +318,7 @@ class TestGetMarketplaceCreators:
             assert "total_reviews" in creator
 
     async def test_creators_public_no_auth_required(
-        self, client: AsyncClient
+        self, client: AsyncClient, init_database
     ):
         """Test that marketplace creators are public."""
         response = await client.get("/marketplace/creators")
@@ -343,20 +339,14 @@ class TestMarketplacePlatformAnalytics:
         )
 
         # Add platform with analytics
-        await Database.execute(
-            """
-            INSERT INTO creator_platforms
-            (creator_id, name, handle, followers, engagement_rate, top_countries, top_age_groups, gender_split)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            """,
-            creator["creator"]["id"],
-            "Instagram",
-            "@analytics",
-            100000,
-            4.5,
-            json.dumps({"USA": 45, "UK": 20}),
-            json.dumps({"25-34": 40, "35-44": 30}),
-            json.dumps({"male": 40, "female": 58, "other": 2})
+        await create_test_platform(
+            creator_id=creator["creator"]["id"],
+            handle="@analytics",
+            followers=100000,
+            engagement_rate=4.5,
+            top_countries=json.dumps({"USA": 45, "UK": 20}),
+            top_age_groups=json.dumps({"25-34": 40, "35-44": 30}),
+            gender_split=json.dumps({"male": 40, "female": 58, "other": 2})
         )
 
         response = await client.get("/marketplace/creators")
@@ -4,10 +4,9 @@ Tests for file upload endpoints.
 import pytest
 from httpx import AsyncClient
 from io import BytesIO
+from unittest.mock import patch
 from PIL import Image
 
-from tests.conftest import get_auth_headers
-
 
 def create_test_image(
     width: int = 100,
@@ -39,7 +38,7 @@ class TestUploadImage:
         response = await client.post(
             "/upload/image",
             files={"file": ("test.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -57,7 +56,7 @@ class TestUploadImage:
         response = await client.post(
             "/upload/image",
             files={"file": ("test.png", image_data, "image/png")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -73,7 +72,7 @@ class TestUploadImage:
         response = await client.post(
             "/upload/image",
             files={"file": ("test.webp", image_data, "image/webp")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -89,7 +88,7 @@ class TestUploadImage:
         response = await client.post(
             "/upload/image",
             files={"file": ("test.txt", invalid_file, "text/plain")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -101,7 +100,7 @@ class TestUploadImage:
         response = await client.post(
             "/upload/image",
             files={"file": ("empty.jpg", b"", "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -129,7 +128,7 @@ class TestUploadImage:
             "/upload/image",
             files={"file": ("test.jpg", image_data, "image/jpeg")},
             params={"prefix": "custom-prefix"},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -153,7 +152,7 @@ class TestUploadMultipleImages:
                 ("files", ("test1.jpg", image1, "image/jpeg")),
                 ("files", ("test2.jpg", image2, "image/jpeg"))
             ],
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -175,7 +174,7 @@ class TestUploadMultipleImages:
                 ("files", ("valid.jpg", valid_image, "image/jpeg")),
                 ("files", ("invalid.txt", invalid_file, "text/plain"))
             ],
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -190,7 +189,7 @@ class TestUploadMultipleImages:
         response = await client.post(
             "/upload/images",
             files=[],
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         # Should fail validation
@@ -209,7 +208,7 @@ class TestUploadMultipleImages:
                 ("files", ("invalid1.txt", invalid1, "text/plain")),
                 ("files", ("invalid2.txt", invalid2, "text/plain"))
             ],
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -227,7 +226,7 @@ class TestUploadHotelProfileImage:
         response = await client.post(
             "/upload/image/hotel-profile",
             files={"file": ("hotel.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -260,7 +259,7 @@ class TestUploadListingImage:
         response = await client.post(
             "/upload/image/listing",
             files={"file": ("listing.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -297,7 +296,7 @@ class TestUploadListingImages:
                 ("files", ("listing1.jpg", image1, "image/jpeg")),
                 ("files", ("listing2.jpg", image2, "image/jpeg"))
             ],
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -316,7 +315,7 @@ class TestUploadListingImages:
         response = await client.post(
             f"/upload/images/listing?target_user_id={target_user_id}",
             files=[("files", ("listing.jpg", image_data, "image/jpeg"))],
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -337,7 +336,7 @@ class TestUploadCreatorProfileImage:
         response = await client.post(
             "/upload/image/creator-profile",
             files={"file": ("profile.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -354,7 +353,7 @@ class TestUploadCreatorProfileImage:
         response = await client.post(
             f"/upload/image/creator-profile?target_user_id={target_user_id}",
             files={"file": ("profile.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_admin["token"])
+            headers=test_admin["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -369,8 +368,6 @@ class TestS3Configuration:
         self, client: AsyncClient, test_creator
     ):
         """Test that upload fails gracefully when S3 is not configured."""
-        from unittest.mock import patch
-
         image_data = create_test_image()
 
         # Mock settings to have empty S3 bucket name
@@ -380,7 +377,7 @@ class TestS3Configuration:
             response = await client.post(
                 "/upload/image",
                 files={"file": ("test.jpg", image_data, "image/jpeg")},
-                headers=get_auth_headers(test_creator["token"])
+                headers=test_creator["auth_headers"]
             )
 
             assert response.status_code == 503
@@ -399,7 +396,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -416,7 +413,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.png", image_data, "image/png")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -432,7 +429,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.webp", image_data, "image/webp")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -448,7 +445,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.gif", image_data, "image/gif")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -464,7 +461,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.txt", invalid_file, "text/plain")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -477,7 +474,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("empty.jpg", b"", "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -513,7 +510,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("large.jpg", large_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400
@@ -528,7 +525,7 @@ class TestUploadChatImage:
         response = await client.post(
             "/upload/image/chat",
             files={"file": ("chat.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_hotel["token"])
+            headers=test_hotel["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -549,7 +546,7 @@ class TestImageValidation:
         response = await client.post(
             "/upload/image",
             files={"file": ("test.jpg", image_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 201
@@ -568,7 +565,7 @@ class TestImageValidation:
         response = await client.post(
             "/upload/image",
             files={"file": ("corrupted.jpg", corrupted_data, "image/jpeg")},
-            headers=get_auth_headers(test_creator["token"])
+            headers=test_creator["auth_headers"]
         )
 
         assert response.status_code == 400